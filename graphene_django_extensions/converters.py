@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from copy import deepcopy
+from functools import cache
 from typing import TYPE_CHECKING
 
 import graphene
@@ -47,6 +48,7 @@
 ]
 
 
+@cache
 def convert_serializer_fields_to_not_required(
     serializer_class: type[ModelSerializer],
     lookup_field: FieldNameStr | None,
@@ -64,6 +66,8 @@ def convert_serializer_fields_to_not_required(
     :param serializer_class: The serializer class to convert.
     :param lookup_field: The lookup field to be used for the update operation.
     :param top_level: Whether this is the top-level serializer.
+
+    Converted classes are cached, so converting the same serializer again returns the same class.
     """
     # We need to create a new serializer and rename it since
     # `graphene_django.rest_framework.serializer_converter.convert_serializer_to_input_type`.
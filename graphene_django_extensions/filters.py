@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import operator
+from functools import cache, reduce
 from typing import TYPE_CHECKING
 
 import django_filters
@@ -23,7 +25,7 @@
 from .typing import FieldAliasToLookup, FilterFields, FilterSetMeta, UserDefinedFilterInput, UserDefinedFilterResult
 
 if TYPE_CHECKING:
-    from .typing import Any, OrderingFunc
+    from .typing import Any, Callable, OrderingFunc
 
 __all__ = [
     "CustomOrderingFilter",
@@ -36,6 +38,15 @@
 ]
 
 
+# How filters of each logical operation are combined into a single filter.
+LOGICAL_OPERATIONS: dict[str, Callable[[Q, Q], Q]] = {
+    "AND": operator.and_,
+    "OR": operator.or_,
+    "NOT": lambda output, ftr: output & ~ftr,
+    "XOR": operator.xor,
+}
+
+
 class EnumChoiceFilterMixin:
     def __init__(self, enum: type[models.Choices], *args: Any, **kwargs: Any) -> None:
         kwargs["enum"] = enum
@@ -121,7 +132,7 @@ def build_user_defined_filters(self, data: UserDefinedFilterInput) -> UserDefine
 
                 filters.extend(result.filters)
 
-        elif data.operation.value in ("AND", "OR", "XOR", "NOT"):
+        elif data.operation.value in LOGICAL_OPERATIONS:
             if data.operations is None:
                 msg = "Logical filter operation requires 'operations' to be set."
                 raise ValueError(msg)
@@ -145,7 +156,7 @@ def build_user_defined_filters(self, data: UserDefinedFilterInput) -> UserDefine
         return UserDefinedFilterResult(filters=filters, annotations=ann, ordering=ordering)
 
     def build_logical_filter(self, data: UserDefinedFilterInput, annotations: dict[str, Any], ordering: list[str]) -> Q:
-        output = Q()
+        filters: list[Q] = []
 
         for operation in data.operations:
             result = self.build_user_defined_filters(operation)
@@ -154,36 +165,38 @@ def build_logical_filter(self, data: UserDefinedFilterInput, annotations: dict[s
             if result.ordering:  # pragma: no cover
                 ordering.extend(result.ordering)
 
-            for ftr in result.filters:
-                if data.operation.value == "AND":
-                    output &= ftr
-                elif data.operation.value == "OR":
-                    output |= ftr
-                elif data.operation.value == "NOT":
-                    output &= ~ftr
-                elif data.operation.value == "XOR":
-                    output ^= ftr
+            filters.extend(result.filters)
 
-        return output
+        return reduce(LOGICAL_OPERATIONS[data.operation.value], filters, Q())
 
     @staticmethod
     def _normalize_fields(model: type[Model], fields: FilterFields) -> FieldAliasToLookup:
-        if fields == ALL_FIELDS:  # pragma: no cover
-            return {to_camel_case(field.name): field.name for field in model._meta.get_fields()}
-
-        normalized_fields: FieldAliasToLookup = {}
-        for field in fields:
-            if isinstance(field, tuple):
-                normalized_fields[to_camel_case(field[1])] = field[0]
-            else:
-                normalized_fields[to_camel_case(field)] = field
-        return normalized_fields
+        # Normalize the fields only once for the same model and fields, since converting to camel case is slow.
+        # Return a copy so that the cached mapping cannot be modified through a filter.
+        if fields != ALL_FIELDS:
+            # Field and alias pairs can also be given as lists, but those cannot be used as cache keys.
+            fields = tuple(tuple(field) if isinstance(field, list) else field for field in fields)
+        return dict(_normalize_fields(model, fields))
 
     def get_field_name(self, data: UserDefinedFilterInput) -> str:
         alias: str = getattr(data.field, "name", data.field)
         return self.extra["fields"][alias]
 
 
+@cache
+def _normalize_fields(model: type[Model], fields: FilterFields) -> FieldAliasToLookup:
+    if fields == ALL_FIELDS:  # pragma: no cover
+        return {to_camel_case(field.name): field.name for field in model._meta.get_fields()}
+
+    normalized_fields: FieldAliasToLookup = {}
+    for field in fields:
+        if isinstance(field, tuple):
+            normalized_fields[to_camel_case(field[1])] = field[0]
+        else:
+            normalized_fields[to_camel_case(field)] = field
+    return normalized_fields
+
+
 class CustomOrderingFilter(django_filters.OrderingFilter):
     """
     Ordering filter for handling custom orderings by defining `order_by_{name}` functions
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import dataclasses
+from functools import cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from django.db import models
@@ -8,6 +10,8 @@
 from .errors import GQLNotFoundError
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from django.db.models import ForeignObjectRel
     from django.db.models.fields.related import RelatedField
 
@@ -40,7 +44,7 @@ def get_model_lookup_field(model_class: type[models.Model], lookup_field: str |
     return lookup_field
 
 
-@dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class RelatedFieldInfo:
     """Information about a related field on a model."""
 
@@ -49,29 +53,33 @@ class RelatedFieldInfo:
     forward: bool
     relation: RelationType
 
-    @property
-    def one_to_one(self) -> bool:
-        return self.relation == "one_to_one"
-
-    @property
-    def many_to_one(self) -> bool:
-        return self.relation == "many_to_one"
+    # Flags computed from the fields above.
+    one_to_one: bool = dataclasses.field(init=False, repr=False, compare=False)
+    many_to_one: bool = dataclasses.field(init=False, repr=False, compare=False)
+    one_to_many: bool = dataclasses.field(init=False, repr=False, compare=False)
+    many_to_many: bool = dataclasses.field(init=False, repr=False, compare=False)
+    reverse: bool = dataclasses.field(init=False, repr=False, compare=False)
 
-    @property
-    def one_to_many(self) -> bool:
-        return self.relation == "one_to_many"
+    def __post_init__(self) -> None:
+        # Set flags once, since they're checked for every related field when saving serializers.
+        object.__setattr__(self, "one_to_one", self.relation == "one_to_one")
+        object.__setattr__(self, "many_to_one", self.relation == "many_to_one")
+        object.__setattr__(self, "one_to_many", self.relation == "one_to_many")
+        object.__setattr__(self, "many_to_many", self.relation == "many_to_many")
+        object.__setattr__(self, "reverse", not self.forward)
 
-    @property
-    def many_to_many(self) -> bool:
-        return self.relation == "many_to_many"
 
-    @property
-    def reverse(self) -> bool:
-        return not self.forward
+def get_related_field_info(model: type[models.Model]) -> dict[str, RelatedFieldInfo]:
+    """
+    Map of all related fields on the given model to their related entity's field names.
+    Returns a copy of the cached mapping, so callers are free to modify it.
+    """
+    return dict(_get_related_field_info(model))
 
 
-def get_related_field_info(model: type[models.Model]) -> dict[str, RelatedFieldInfo]:
-    """Map of all related fields on the given model to their related entity's field names."""
+@cache
+def _get_related_field_info(model: type[models.Model]) -> Mapping[str, RelatedFieldInfo]:
+    # Cached per model, since model fields don't change after the app registry is ready.
     mapping: dict[str, RelatedFieldInfo] = {}
     for field in model._meta.get_fields():
         if isinstance(field, models.OneToOneRel | models.ManyToOneRel | models.ManyToManyRel):
@@ -93,7 +101,7 @@ def get_related_field_info(model: type[models.Model]) -> dict[str, RelatedFieldI
             )
             continue
 
-    return mapping
+    return MappingProxyType(mapping)
 
 
 def _get_relation_type(field: ForeignObjectRel | RelatedField) -> RelationType:
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import dataclasses
+from copy import deepcopy
 from functools import wraps
 from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
-from django.db import IntegrityError, models, transaction
+from django.db import IntegrityError, connections, models, router, transaction
 from django.db.models import NOT_PROVIDED
 from graphene_django.types import ALL_FIELDS
 from rest_framework.exceptions import ValidationError
 from rest_framework.relations import ManyRelatedField, RelatedField
 from rest_framework.serializers import ListSerializer, ModelSerializer
+from rest_framework.validators import UniqueValidator
 
 from .errors import get_constraint_message
 from .fields import DurationField, EnumFriendlyChoiceField, IntegerPrimaryKeyField
@@ -18,6 +21,8 @@
 from .typing import ParamSpec, SerializerMeta, TypeVar
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from django.db.models import Model
     from rest_framework.fields import Field
 
@@ -47,6 +52,9 @@ def __bool__(self) -> bool:
 T = TypeVar("T")
 P = ParamSpec("P")
 
+# Fields built for serializer classes with 'Meta.cache_fields'. Instances get deep copies of these.
+_FIELD_BLUEPRINTS: WeakKeyDictionary[type[NestingModelSerializer], dict[str, Field]] = WeakKeyDictionary()
+
 
 def _related_pre_and_post_save(func: Callable[P, T]) -> Callable[P, T]:
     """Handle related models before and after creating or updating the main model."""
@@ -124,6 +132,53 @@ def get_update_or_create(self, data: dict[str, Any] | None) -> Model | None:
 
         return self.create(data)
 
+    def get_update_or_create_many(self, items: list[dict[str, Any]]) -> list[Model]:
+        """
+        Update or create all given entities. If 'Meta.bulk_create' is set to True, new entities
+        that don't contain nested relations are created with a single query. Note that this
+        skips 'Model.save()' and doesn't send save signals for these entities.
+
+        Bulk creation is only used if the database returns primary keys from bulk inserts,
+        since the created entities are needed for linking and deleting related entities.
+        """
+        if not getattr(self.Meta, "bulk_create", False) or not self._can_return_rows_from_bulk_insert():
+            instances = (self.get_update_or_create(item) for item in items)
+            return [instance for instance in instances if instance is not None]
+
+        related_info = get_related_field_info(self.Meta.model)
+        instances: list[Model] = []
+        new_instances: list[Model] = []
+        for item in items:
+            if item is not None and self._can_bulk_create(item, related_info):
+                new_instances.append(self.Meta.model(**item))
+                continue
+
+            instance = self.get_update_or_create(item)
+            if instance is not None:
+                instances.append(instance)
+
+        if new_instances:
+            instances += self.Meta.model._default_manager.bulk_create(new_instances)
+        return instances
+
+    def _can_return_rows_from_bulk_insert(self) -> bool:
+        database = router.db_for_write(self.Meta.model)
+        return connections[database].features.can_return_rows_from_bulk_insert
+
+    @staticmethod
+    def _can_bulk_create(data: dict[str, Any], related_info: Mapping[str, RelatedFieldInfo]) -> bool:
+        """New entities can be bulk created if they only refer to existing entities through forward to-one relations."""
+        if "pk" in data:
+            return False
+
+        for name, value in data.items():
+            info = related_info.get(name, None)
+            if info is None:
+                continue
+            if info.reverse or info.many_to_many or not isinstance(value, models.Model | None):
+                return False
+        return True
+
     @_related_pre_and_post_save
     def create(self, validated_data: dict[str, Any]) -> Model:
         """Create a new instance of the model, while also handling related models."""
@@ -230,13 +285,11 @@ def _post_handle_reverse_one_to_one(self, instance: Model, info: PreSaveInfo) ->
 
     def _post_handle_one_to_many(self, instance: Model, info: PreSaveInfo) -> None:
         if isinstance(info.field, ListSerializer) and isinstance(info.field.child, NestingModelSerializer):
-            pks: list[Any] = []
-
             for initial_data in info.initial_data:
                 initial_data[info.related_info.related_name] = instance
-                nested_instance = info.field.child.get_update_or_create(initial_data)
-                if nested_instance is not None:
-                    pks.append(nested_instance.pk)
+
+            nested_instances = info.field.child.get_update_or_create_many(info.initial_data)
+            pks: list[Any] = [nested_instance.pk for nested_instance in nested_instances]
 
             # Delete related objects that were not created or modified.
             selector = {info.related_info.related_name: instance}
@@ -249,12 +302,7 @@ def _post_handle_one_to_many(self, instance: Model, info: PreSaveInfo) -> None:
 
     def _post_handle_many_to_many(self, instance: Model, info: PreSaveInfo) -> None:
         if isinstance(info.field, ListSerializer) and isinstance(info.field.child, NestingModelSerializer):
-            instances: list[Model] = []
-
-            for item in info.initial_data:
-                nested_instance = info.field.child.get_update_or_create(item)
-                if nested_instance is not None:
-                    instances.append(nested_instance)
+            instances = info.field.child.get_update_or_create_many(info.initial_data)
 
             # Add related objects that were not previously linked to the main model.
             getattr(instance, info.related_info.field_name).set(instances)
@@ -264,7 +312,51 @@ def _post_handle_many_to_many(self, instance: Model, info: PreSaveInfo) -> None:
             getattr(instance, info.related_info.field_name).set(info.initial_data)
             return
 
+    def build_standard_field(self, field_name: str, model_field: models.Field) -> tuple[type[Field], dict[str, Any]]:
+        field_class, field_kwargs = super().build_standard_field(field_name, model_field)
+        return field_class, self._remove_unique_validators(field_kwargs)
+
+    def build_relational_field(self, field_name: str, relation_info: Any) -> tuple[type[Field], dict[str, Any]]:
+        field_class, field_kwargs = super().build_relational_field(field_name, relation_info)
+        return field_class, self._remove_unique_validators(field_kwargs)
+
+    def _remove_unique_validators(self, field_kwargs: dict[str, Any]) -> dict[str, Any]:
+        if getattr(self.Meta, "rely_on_db_constraints", False) and "validators" in field_kwargs:
+            # Unique fields are checked by the database on save, so don't query for them during validation.
+            field_kwargs["validators"] = [
+                validator for validator in field_kwargs["validators"] if not isinstance(validator, UniqueValidator)
+            ]
+        return field_kwargs
+
+    def get_validators(self) -> list[Callable[..., Any]]:
+        if not getattr(self.Meta, "rely_on_db_constraints", False):
+            return super().get_validators()
+        # Unique together validators are checked by the database on save, but 'unique_for_date' is not.
+        validators = getattr(self.Meta, "validators", None)
+        if validators is not None:
+            return list(validators)
+        return self.get_unique_for_date_validators()
+
     def get_fields(self) -> dict[str, Field]:
+        if not getattr(self.Meta, "cache_fields", False):
+            return self._build_fields()
+
+        # Building fields from model introspection is slow, so build them only once per serializer class.
+        # Each instance gets deep copies, like DRF does for declared fields, since fields are bound to their parent.
+        # This means that fields cannot depend on the instance, e.g., its context or the request.
+        blueprint = _FIELD_BLUEPRINTS.get(type(self))
+        if blueprint is None:
+            blueprint = _FIELD_BLUEPRINTS[type(self)] = self._build_fields()
+
+        fields = deepcopy(blueprint)
+        for name, field in fields.items():
+            # Deep copies are made from field constructor arguments, so attributes set after construction
+            # (like enums added in '_build_fields') need to be copied separately.
+            if hasattr(field, "enum") and field.enum is None:
+                field.enum = blueprint[name].enum
+        return fields
+
+    def _build_fields(self) -> dict[str, Field]:
         fields = super().get_fields()
         # Add the model field enum to `EnumFriendlyChoiceField`
         # if the enum was not explicitly defined in the serializer field.
@@ -4,6 +4,7 @@
 import uuid
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cache, lru_cache
 from itertools import chain
 
 from django.db.models import lookups
@@ -53,11 +54,43 @@ def build_query(__name: str, *, fields: str = "pk", connection: bool = False, **
     :param filter_params: Parameters to use in the query. Will be converted to camelCase.
                           Use "__" to add filters to fields instead of the query.
     """
+    key = tuple((name, _freeze(value)) for name, value in filter_params.items())
+    try:
+        hash(key)
+    except TypeError:  # Unhashable filter values, cannot cache.
+        return _build_query(__name, fields, connection, filter_params)
+    return _build_query_cached(__name, fields, connection, key)
+
+
+@lru_cache(maxsize=256)
+def _build_query_cached(name: str, fields: str, connection: bool, key: tuple[tuple[str, Any], ...]) -> str:  # noqa: FBT001
+    return _build_query(name, fields, connection, {param: _thaw(value) for param, value in key})
+
+
+def _freeze(value: Any) -> tuple[type, Any]:
+    """
+    Include the type of the value in the cache key, since e.g. '1', 'True' and '1.0'
+    have the same hash, but are formatted differently in the query.
+    """
+    if isinstance(value, list | tuple):
+        return tuple, tuple(_freeze(item) for item in value)
+    return type(value), value
+
+
+def _thaw(frozen: tuple[type, Any]) -> Any:
+    value_type, value = frozen
+    if value_type is tuple:
+        return tuple(_thaw(item) for item in value)
+    return value
+
+
+def _build_query(name: str, fields: str, connection: bool, filter_params: dict[str, Any]) -> str:  # noqa: FBT001
     result = _build_filters(fields, **filter_params)
     fields = f"edges {{ node {{ {result.fields} }} }}" if connection else result.fields
-    return f"query {{ {__name}{result.query_filters} {{ {fields} }} }}"
+    return f"query {{ {name}{result.query_filters} {{ {fields} }} }}"
 
 
+@cache
 def build_mutation(__name: str, __mutation_class_name: str, *, fields: str = "pk") -> str:  # noqa: PYI063
     """
     Build a GraphqQL mutation with the given field selections.
@@ -119,12 +152,12 @@ def _split_lookups(key: str) -> tuple[str, str]:
 def _format_value_for_filter(value: Any, *, is_order_by: bool = False) -> str:
     """Format values for the GraphQL filters. For enums, use the enum value. Otherwise, format as json."""
     if is_order_by:  # using custom enum `order_by` values
-        if isinstance(value, list):
+        if isinstance(value, list | tuple):
             return f"[{', '.join(item for item in value)}]"
         return value
     if isinstance(value, Enum):
         return value.value
-    if isinstance(value, list) and all(isinstance(item, Enum) for item in value):
+    if isinstance(value, list | tuple) and all(isinstance(item, Enum) for item in value):
         return f"[{', '.join(str(item.value) for item in value)}]"
     if isinstance(value, uuid.UUID):
         value = str(value)
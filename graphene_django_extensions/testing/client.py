@@ -2,11 +2,15 @@
 
 import json
 import re
+from functools import cached_property
+from http.cookies import SimpleCookie
 from typing import TYPE_CHECKING
 
 import pytest
 from django.contrib.auth import get_user_model
-from django.test.client import MULTIPART_CONTENT, Client
+from django.contrib.auth.models import AnonymousUser
+from django.test.client import MULTIPART_CONTENT, Client, RequestFactory
+from django.urls import resolve
 from graphene_django.settings import graphene_settings
 
 from graphene_django_extensions.files import extract_files
@@ -38,8 +42,9 @@
 
 class GQLResponse:
     def __init__(self, response: HttpResponse, query_data: QueryData) -> None:
-        # 'django.test.client.Client.request' sets json attribute on the response.
-        self.json: dict[str, Any] = response.json()  # type: ignore[attr-defined]
+        # Parse the content directly instead of using 'response.json()' set by 'django.test.client.Client.request',
+        # since responses from 'GraphQLClient.execute_raw' don't go through the test client.
+        self.json: dict[str, Any] = json.loads(response.content)
         self.query_data = query_data
 
     def __str__(self) -> str:
@@ -88,10 +93,11 @@ def first_query_object(self) -> dict[str, Any] | list[Any] | None:
             msg = f"No query object not found in response content: {self.json}"
             pytest.fail(msg, pytrace=False)
 
-    @property
+    @cached_property
     def edges(self) -> list[dict[str, Any]]:
         """
         Return edges from the first query in the response content.
+        Cached, since response content doesn't change.
 
         >>> self.json = {"data": {"foo": {"edges": [{"node": {"name": "bar"}}]}}}
         >>> self.edges
@@ -230,16 +236,20 @@ def field_error_messages(self, field: str = "nonFieldErrors") -> list[str]:  # p
         >>> self.field_error_messages("foo")
         ["bar", "one"]
         """
-        messages: list[str] = []
-        for error in self.field_errors:
-            if error.get("field") == field:
-                try:
-                    messages.append(error["message"])
-                except (KeyError, TypeError):
-                    msg = f"Error message for field {field!r} not found in error: {error}"
-                    pytest.fail(msg, pytrace=False)
+        errors = self._field_errors_by_field.get(field, [])
+        try:
+            return [error["message"] for error in errors]
+        except (KeyError, TypeError):
+            msg = f"Error message for field {field!r} not found in errors: {errors}"
+            pytest.fail(msg, pytrace=False)
 
-        return messages
+    @cached_property
+    def _field_errors_by_field(self) -> dict[str | None, list[FieldError]]:
+        """Field errors grouped by field, so that errors for any field can be looked up without a full scan."""
+        errors_by_field: dict[str | None, list[FieldError]] = {}
+        for error in self.field_errors:
+            errors_by_field.setdefault(error.get("field"), []).append(error)
+        return errors_by_field
 
     def error_code(self, selector: int | str = 0) -> str:  # pragma: no cover
         """
@@ -328,14 +338,20 @@ def has_schema_errors(self) -> bool:
         return any(any(e.match(error["message"]) is not None for e in SCHEMA_ERRORS) for error in self.errors)
 
     def assert_query_count(self, count: int) -> None:  # pragma: no cover
-        if len(self.queries) != count:
-            msg = f"Expected {count} queries, got {len(self.queries)}.\n{self.query_log}"
+        if len(self.query_data.queries) != count:
+            msg = f"Expected {count} queries, got {len(self.query_data.queries)}.\n{self.query_log}"
             pytest.fail(msg, pytrace=False)
 
 
 class GraphQLClient(Client):
     response_class: ClassVar[type[GQLResponse]] = GQLResponse
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Defaults given on creation, so that 'reset' can restore them. The sync test client
+        # merges the 'headers' argument into these as 'HTTP_*' keys instead of storing it separately.
+        self._initial_defaults: dict[str, Any] = self.defaults.copy()
+
     def __call__(
         self: Self,
         query: str,
@@ -353,6 +369,62 @@ def __call__(
         :params headers: Headers for the query.
         :params operation_name: Name of the operation to execute.
         """
+        data, content_type = self._build_request_data(query, input_data, variables, operation_name)
+
+        with capture_database_queries() as results:
+            response: HttpResponse = self.post(  # type: ignore[assignment]
+                path=graphene_settings.TESTING_ENDPOINT,
+                data=data,
+                content_type=content_type,
+                headers=headers,
+            )
+
+        return self.response_class(response, results)
+
+    def execute_raw(  # noqa: PLR0913
+        self: Self,
+        query: str,
+        input_data: dict[str, Any] | None = None,
+        variables: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        operation_name: str | None = None,
+        *,
+        user: User | AnonymousUser | None = None,
+    ) -> GQLResponse:
+        """
+        Make a GraphQL query directly to the GraphQL view, skipping Django's middleware stack.
+        Use for tests that don't need sessions, authentication, or CSRF checks.
+
+        :params query: GraphQL query string.
+        :params input_data: Set (and override) the "input" variable in the given variables.
+        :params variables: Variables for the query.
+        :params headers: Headers for the query.
+        :params operation_name: Name of the operation to execute.
+        :params user: User to set as the request user. Anonymous user if not given.
+        """
+        data, content_type = self._build_request_data(query, input_data, variables, operation_name)
+
+        request = RequestFactory().post(
+            path=graphene_settings.TESTING_ENDPOINT,
+            data=data,
+            content_type=content_type,
+            headers=headers,
+        )
+        request.user = user if user is not None else AnonymousUser()
+        view = resolve(graphene_settings.TESTING_ENDPOINT).func
+
+        with capture_database_queries() as results:
+            response: HttpResponse = view(request)
+
+        return self.response_class(response, results)
+
+    @staticmethod
+    def _build_request_data(
+        query: str,
+        input_data: dict[str, Any] | None,
+        variables: dict[str, Any] | None,
+        operation_name: str | None,
+    ) -> tuple[str | dict[str, Any], str]:
         variables: dict[str, Any] = variables or {}
         if input_data is not None:
             variables.update({"input": input_data})
@@ -372,22 +444,23 @@ def __call__(
             body["operationName"] = operation_name
 
         data = json.dumps(body)
-        if files:
-            data = {
-                "operations": data,
-                "map": json.dumps(path_map),
-                **files_map,
-            }
+        if not files:
+            return data, "application/json"
 
-        with capture_database_queries() as results:
-            response: HttpResponse = self.post(  # type: ignore[assignment]
-                path=graphene_settings.TESTING_ENDPOINT,
-                data=data,
-                content_type=MULTIPART_CONTENT if files else "application/json",
-                headers=headers,
-            )
+        data = {
+            "operations": data,
+            "map": json.dumps(path_map),
+            **files_map,
+        }
+        return data, MULTIPART_CONTENT
 
-        return self.response_class(response, results)
+    def reset(self) -> None:
+        """
+        Log out, forget all cookies, and restore the defaults given on creation,
+        so that the client can be reused, e.g., between tests.
+        """
+        self.cookies = SimpleCookie()
+        self.defaults = self._initial_defaults.copy()
 
     def login_with_superuser(self, username: str = "admin", **kwargs: Any) -> User:
         defaults = {
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from collections import Counter
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import partial
 from inspect import cleandoc
 from io import BytesIO
@@ -25,7 +26,8 @@
 
 @dataclass
 class QueryData:
-    queries: list[str]
+    # Executed queries. Pretty printed with 'sqlparse' only when 'log' is accessed.
+    queries: list[str] = field(default_factory=list)
 
     @property
     def log(self) -> str:
@@ -64,8 +66,11 @@ def _db_query_logger(  # noqa: PLR0913
 
 @contextmanager
 def capture_database_queries() -> Generator[QueryData, None, None]:
-    """Capture results of what database queries were executed. `DEBUG` needs to be set to True."""
-    results = QueryData(queries=[])
+    """
+    Capture results of what database queries were executed.
+    Uses a database execute wrapper, so `DEBUG` doesn't need to be set to True.
+    """
+    results = QueryData()
     query_logger = partial(_db_query_logger, query_cache=results.queries)
 
     with db.connection.execute_wrapper(query_logger):
@@ -197,6 +202,11 @@ def _compare_unordered(actual: Any, expected: Any) -> None:  # noqa: PLR0912, C9
                     error.expected_key = f"[-]{error.expected_key}"
                     raise
         else:
+            # Lists of strings or integers are equal if they have the same items the same number of times,
+            # which can be checked without sorting. Otherwise, compare sorted items to find the first difference.
+            if issubclass(actual_type, str | int) and Counter(actual) == Counter(expected):
+                return
+
             for act, exp in zip(sorted(actual), sorted(expected), strict=False):
                 try:
                     _compare_unordered(act, exp)
@@ -143,6 +143,9 @@ class SerializerMeta:
     depth: int
     extra_kwargs: Mapping[FieldNameStr, Mapping[str, Any]]
     node: DjangoNode
+    bulk_create: bool
+    rely_on_db_constraints: bool
+    cache_fields: bool
 
 
 class FilterSetMeta:
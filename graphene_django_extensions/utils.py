@@ -30,25 +30,23 @@ def get_nested(obj: dict | list | None, /, *args: str | int, default: Any = None
     2) `get_nested(data, "foo", 0, "bar", "baz")`
      - Will return `None` (default) if any of the keys or indices don't exist.
     """
-    if not args:
-        return obj if obj is not None else default
+    for arg in args:
+        if obj is None:
+            return default
 
-    arg, args = args[0], args[1:]
+        if isinstance(arg, int):
+            try:
+                obj = (obj or [])[arg]
+            except (IndexError, KeyError):
+                return default
+            continue
 
-    if isinstance(arg, int):
-        obj = obj or []
         try:
-            obj = obj[arg]
-        except (IndexError, KeyError):
-            obj = None
-        return get_nested(obj, *args, default=default)
-
-    obj = obj or {}
-    try:
-        return get_nested(obj.get(arg), *args, default=default)
-    except AttributeError:
-        obj = None
-        return get_nested(obj, *args, default=default)
+            obj = (obj or {}).get(arg)
+        except AttributeError:
+            return default
+
+    return obj if obj is not None else default
 
 
 @cache
@@ -1,35 +1,95 @@
 from importlib import reload
 
 import pytest
+from django.conf import settings as django_settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.test import override_settings
 from graphene_django import views
 
 from example_project.app import nodes, schema
+from graphene_django_extensions.testing import GraphQLClient
+
+User = get_user_model()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _test_settings(django_test_environment):
+    # Settings only for making tests faster.
+    # - No test checks password hashing, so use the fastest hasher in case a password is set.
+    # - No test queries the '_debug' field, so don't record SQL queries for it on every request.
+    graphene = django_settings.GRAPHENE.copy()
+    graphene["MIDDLEWARE"] = [
+        middleware
+        for middleware in graphene["MIDDLEWARE"]
+        if middleware != "graphene_django.debug.DjangoDebugMiddleware"
+    ]
+    with override_settings(
+        PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+        GRAPHENE=graphene,
+    ):
+        yield
+
+
+@pytest.fixture(scope="module")
+def _graphql_client():
+    return GraphQLClient()
 
 
 @pytest.fixture()
-def experimental_translation_fields(settings, request):
+def graphql(_graphql_client):
+    # Reuse the client within a module, so that its middleware chain is loaded only once.
+    yield _graphql_client
+    _graphql_client.reset()
+
+
+@pytest.fixture(scope="module")
+def superuser(module_db, django_db_blocker):
+    # Created once per module, and rolled back with the module's data. Log in with 'graphql.force_login(superuser)'.
+    with django_db_blocker.unblock():
+        return User.objects.create(
+            username="admin",
+            email="superuser@django.com",
+            is_staff=True,
+            is_superuser=True,
+        )
+
+
+@pytest.fixture(scope="module")
+def experimental_translation_fields(request):
+    # Module-scoped, since recreating the schema is slow. Pytest groups tests using the same parameter,
+    # so the schema is recreated once per parameter in a module. Tests in a module using this fixture
+    # should all use it, since the schema stays changed until the module's last test is done.
     param = getattr(request, "param", "types")
 
-    old_settings = settings.GRAPHENE_DJANGO_EXTENSIONS.copy()
+    extensions = {
+        **django_settings.GRAPHENE_DJANGO_EXTENSIONS,
+        "EXPERIMENTAL_TRANSLATION_FIELDS": True,
+        "EXPERIMENTAL_TRANSLATION_FIELDS_KIND": param,
+    }
     try:
-        settings.GRAPHENE_DJANGO_EXTENSIONS = {
-            **old_settings,
-            "EXPERIMENTAL_TRANSLATION_FIELDS": True,
-            "EXPERIMENTAL_TRANSLATION_FIELDS_KIND": param,
-        }
-        # Reload graphene settings so that views know about the new schema.
-        settings.GRAPHENE = settings.GRAPHENE
-
-        # Reload these modules:
-        reload(nodes)  # Recreate nodes
-        reload(schema)  # Recreate schema
-        reload(views)  # Recreate views (new schema added)
-        yield
+        # Also override graphene settings so that views know about the new schema.
+        with override_settings(GRAPHENE_DJANGO_EXTENSIONS=extensions, GRAPHENE=django_settings.GRAPHENE):
+            # Reload these modules:
+            reload(nodes)  # Recreate nodes
+            reload(schema)  # Recreate schema
+            reload(views)  # Recreate views (new schema added)
+            yield
 
     finally:
-        # Restore settings and schema.
-        settings.GRAPHENE_DJANGO_EXTENSIONS = old_settings
-        settings.GRAPHENE = settings.GRAPHENE
+        # Restore schema after settings have been restored.
         reload(nodes)
         reload(schema)
         reload(views)
+
+
+@pytest.fixture(scope="module")
+def module_db(django_db_setup, django_db_blocker):
+    # Like 'TestCase.setUpClass': Data created by module-scoped fixtures depending on this
+    # is shared by all tests in the module, and rolled back after the last test in the module.
+    # Tests run their own transactions inside this one (as savepoints), and database access
+    # is blocked between them like usual.
+    with django_db_blocker.unblock(), transaction.atomic():
+        with django_db_blocker.block():
+            yield
+        transaction.set_rollback(True)
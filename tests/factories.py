@@ -30,7 +30,7 @@
 
 
 class ForwardOneToOneFactory(DjangoModelFactory):
-    name = fuzzy.FuzzyText()
+    name = factory.Sequence(lambda n: f"forward_one_to_one_{n}")
 
     class Meta:
         model = ForwardOneToOne
@@ -41,7 +41,7 @@ def create(cls, **kwargs: Any) -> ForwardOneToOne:
 
 
 class ForwardManyToManyFactory(DjangoModelFactory):
-    name = fuzzy.FuzzyText()
+    name = factory.Sequence(lambda n: f"forward_many_to_many_{n}")
 
     class Meta:
         model = ForwardManyToMany
@@ -52,7 +52,7 @@ def create(cls, **kwargs: Any) -> ForwardManyToMany:
 
 
 class ForwardManyToOneFactory(DjangoModelFactory):
-    name = fuzzy.FuzzyText()
+    name = factory.Sequence(lambda n: f"forward_many_to_one_{n}")
 
     class Meta:
         model = ForwardManyToOne
@@ -63,7 +63,7 @@ def create(cls, **kwargs: Any) -> ForwardManyToOne:
 
 
 class ExampleFactory(DjangoModelFactory):
-    name = fuzzy.FuzzyText(suffix="foo")
+    name = factory.Sequence(lambda n: f"example_{n}_foo")
     number = fuzzy.FuzzyInteger(0)
     email = factory.LazyAttribute(lambda example: f"{example.name}@email.com")
     example_state = fuzzy.FuzzyChoice(choices=ExampleState.values)
@@ -73,11 +73,24 @@ class ExampleFactory(DjangoModelFactory):
 
     class Meta:
         model = Example
+        skip_postgeneration_save = True
 
     @classmethod
     def create(cls, **kwargs: Any) -> Example:
         return super().create(**kwargs)
 
+    @classmethod
+    def bulk_create(cls, attrs_list: Iterable[dict[str, Any]]) -> list[Example]:
+        """Create examples with one INSERT per table. Post-generation hooks are not run."""
+        examples = [cls.build(**attrs) for attrs in attrs_list]
+        ForwardOneToOne.objects.bulk_create(
+            [example.forward_one_to_one_field for example in examples if example.forward_one_to_one_field.pk is None],
+        )
+        ForwardManyToOne.objects.bulk_create(
+            [example.forward_many_to_one_field for example in examples if example.forward_many_to_one_field.pk is None],
+        )
+        return Example.objects.bulk_create(examples)
+
     @factory.post_generation
     def forward_many_to_many_fields(
         self: Example,
@@ -107,7 +120,7 @@ def symmetrical(self: Example, create: bool, objs: Iterable[Example] | None, **k
 
 
 class ReverseOneToOneFactory(DjangoModelFactory):
-    name = fuzzy.FuzzyText()
+    name = factory.Sequence(lambda n: f"reverse_one_to_one_{n}")
     example_field = factory.SubFactory(ExampleFactory)
 
     class Meta:
@@ -119,15 +132,33 @@ def create(cls, **kwargs: Any) -> ReverseOneToOne:
 
 
 class ReverseManyToManyFactory(DjangoModelFactory):
-    name = fuzzy.FuzzyText()
+    name = factory.Sequence(lambda n: f"reverse_many_to_many_{n}")
 
     class Meta:
         model = ReverseManyToMany
+        skip_postgeneration_save = True
 
     @classmethod
     def create(cls, **kwargs: Any) -> ReverseManyToMany:
         return super().create(**kwargs)
 
+    @classmethod
+    def bulk_create(cls, attrs_list: Iterable[dict[str, Any]]) -> list[ReverseManyToMany]:
+        """Create objects and their 'example_fields' with one INSERT per table."""
+        attrs_list = list(attrs_list)
+        objs = ReverseManyToMany.objects.bulk_create(
+            [cls.build(**{key: val for key, val in attrs.items() if key != "example_fields"}) for attrs in attrs_list],
+        )
+        through = ReverseManyToMany.example_fields.through
+        through.objects.bulk_create(
+            [
+                through(reversemanytomany=obj, example=example)
+                for obj, attrs in zip(objs, attrs_list, strict=True)
+                for example in attrs.get("example_fields", [])
+            ],
+        )
+        return objs
+
     @factory.post_generation
     def example_fields(self: ReverseManyToMany, create: bool, objs: Iterable[Example] | None, **kwargs: Any) -> None:
         if not create:
@@ -141,7 +172,7 @@ def example_fields(self: ReverseManyToMany, create: bool, objs: Iterable[Example
 
 
 class ReverseOneToManyFactory(DjangoModelFactory):
-    name = fuzzy.FuzzyText()
+    name = factory.Sequence(lambda n: f"reverse_one_to_many_{n}")
     example_field = factory.SubFactory(ExampleFactory)
 
     class Meta:
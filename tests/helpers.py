@@ -0,0 +1,19 @@
+import datetime
+
+from example_project.app.models import ExampleState
+
+# Duration given in mutation inputs, in seconds.
+DURATION = int(datetime.timedelta(seconds=900).total_seconds())
+
+# Input for creating an example with the 'createExample' mutation.
+# Copy before changing, e.g., '{**CREATE_INPUT, "forwardManyToOneField": mto.pk}'.
+CREATE_INPUT = {
+    "name": "foo",
+    "number": 123,
+    "email": "foo@email.com",
+    "exampleState": ExampleState.ACTIVE.value,
+    "duration": DURATION,
+    "forwardOneToOneField": {
+        "name": "Test",
+    },
+}
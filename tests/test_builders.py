@@ -40,6 +40,20 @@ def test_query_builder__filters__enums_list():
     assert build_query("example", pk=[MyEnum.ONE, MyEnum.TWO]) == "query { example(pk: [ONE, TWO]) { pk } }"
 
 
+def test_query_builder__filters__enums_tuple():
+    assert build_query("example", pk=(MyEnum.ONE, MyEnum.TWO)) == "query { example(pk: [ONE, TWO]) { pk } }"
+
+
+def test_query_builder__filters__unhashable():
+    assert build_query("example", foo={"bar": [1]}) == 'query { example(foo: {"bar": [1]}) { pk } }'
+
+
+def test_query_builder__filters__equal_hash_values():
+    assert build_query("example", foo=1) == "query { example(foo: 1) { pk } }"
+    assert build_query("example", foo=True) == "query { example(foo: true) { pk } }"
+    assert build_query("example", foo=[1.0]) == "query { example(foo: [1.0]) { pk } }"
+
+
 def test_query_builder__field_filters__single():
     assert build_query("example", pk__foo="bar") == 'query { example { pk(foo: "bar") } }'
 
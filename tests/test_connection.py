@@ -8,7 +8,7 @@
 ]
 
 
-def test_connection__total_count(graphql: GraphQLClient):
+def test_connection__total_count(graphql: GraphQLClient, superuser):
     ExampleFactory.create()
     query = """
         query {
@@ -22,7 +22,7 @@ def test_connection__total_count(graphql: GraphQLClient):
             }
         }
     """
-    graphql.login_with_superuser()
+    graphql.force_login(superuser)
     response = graphql(query)
     assert response.has_errors is False, response
     assert response.first_query_object.get("totalCount") == 1, response
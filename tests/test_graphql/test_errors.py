@@ -1,32 +1,20 @@
-import datetime
-
 import pytest
 
-from example_project.app.models import ExampleState
 from graphene_django_extensions.testing import GraphQLClient, build_mutation
 from tests.factories import ExampleFactory, ForwardManyToOneFactory
+from tests.helpers import CREATE_INPUT
 
 pytestmark = [
     pytest.mark.django_db,
 ]
 
 
-def test_graphql__create__validation_error(graphql: GraphQLClient):
+def test_graphql__create__validation_error(graphql: GraphQLClient, superuser):
     mto = ForwardManyToOneFactory.create()
-    input_data = {
-        "name": "foo",
-        "number": -1,
-        "email": "foo@email.com",
-        "exampleState": ExampleState.ACTIVE.value,
-        "duration": int(datetime.timedelta(seconds=900).total_seconds()),
-        "forwardOneToOneField": {
-            "name": "Test",
-        },
-        "forwardManyToOneField": mto.pk,
-    }
+    input_data = {**CREATE_INPUT, "number": -1, "forwardManyToOneField": mto.pk}
 
     mutation = build_mutation("createExample", "ExampleCreateMutation")
-    graphql.login_with_superuser()
+    graphql.force_login(superuser)
     response = graphql(mutation, input_data=input_data)
 
     assert response.error_message() == "Mutation was unsuccessful."
@@ -50,13 +38,13 @@ def test_graphql__create__validation_error(graphql: GraphQLClient):
     ]
 
 
-def test_graphql__update__validation_error(graphql: GraphQLClient):
+def test_graphql__update__validation_error(graphql: GraphQLClient, superuser):
     example = ExampleFactory.create()
 
     input_data = {"pk": example.pk, "name": "foo", "number": -1}
 
     mutation = build_mutation("updateExample", "ExampleUpdateMutation")
-    graphql.login_with_superuser()
+    graphql.force_login(superuser)
     response = graphql(mutation, input_data=input_data)
 
     assert response.error_message() == "Mutation was unsuccessful."
@@ -80,13 +68,13 @@ def test_graphql__update__validation_error(graphql: GraphQLClient):
     ]
 
 
-def test_graphql__delete__validation_error(graphql: GraphQLClient):
+def test_graphql__delete__validation_error(graphql: GraphQLClient, superuser):
     example = ExampleFactory.create(name="foo", number=-1)
 
     input_data = {"pk": example.pk}
 
     mutation = build_mutation("deleteExample", "ExampleDeleteMutation", fields="deleted")
-    graphql.login_with_superuser()
+    graphql.force_login(superuser)
     response = graphql(mutation, input_data=input_data)
 
     assert response.error_message() == "Mutation was unsuccessful."
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-from unittest.mock import patch
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
 
 import pytest
 from query_optimizer.selections import get_field_selections
 
 from example_project.app.filtersets import ExampleFilterSet, ForwardManyToManyFilterSet
-from example_project.app.models import ExampleState
+from example_project.app.models import Example, ExampleState, ForwardManyToMany
 from graphene_django_extensions.testing import GraphQLClient, build_query
 from graphene_django_extensions.utils import get_filter_info
 from tests.factories import ExampleFactory, ForwardManyToManyFactory, ReverseManyToManyFactory
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
     from django.db import models
 
     from graphene_django_extensions.typing import GQLInfo
@@ -21,8 +24,54 @@
     pytest.mark.django_db,
 ]
 
+BOTH_STATES = (ExampleState.ACTIVE, ExampleState.INACTIVE)
+
+
+# Tracker to call instead of `get_filter_info` in the optimizer. Set by `track_filter_info()`.
+_active_tracker: list[Callable[[GQLInfo, type[models.Model]], dict[str, Any]] | None] = [None]
+
+
+def _filter_info_dispatcher(info: GQLInfo, model: type[models.Model]) -> dict[str, Any]:
+    tracker = _active_tracker[0]
+    if tracker is None:
+        return get_filter_info(info, model)
+    return tracker(info, model)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_filter_info():
+    # Patch the optimizer only once for the whole module.
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr("query_optimizer.optimizer.get_filter_info", _filter_info_dispatcher)
+        yield
+
+
+@contextmanager
+def track_filter_info() -> Generator[SimpleNamespace, None, None]:
+    """Capture the field selections and filter info the optimizer computes for the query."""
+    tracked = SimpleNamespace(selections=[], filters={})
+    # Filter info is the same for repeated calls on the same field of the same operation.
+    # Keep the nodes alongside the result so that their ids cannot be reused.
+    cache: dict[tuple[int, int], tuple[Any, Any, dict[str, Any]]] = {}
+
+    def tracker(info: GQLInfo, model: type[models.Model]) -> dict[str, Any]:
+        key = (id(info.operation), id(info.field_nodes[0]))
+        if key in cache:
+            return cache[key][2]
+        if not tracked.selections:
+            tracked.selections = get_field_selections(info, model)
+        tracked.filters = get_filter_info(info, model)
+        cache[key] = (info.operation, info.field_nodes[0], tracked.filters)
+        return tracked.filters
+
+    _active_tracker[0] = tracker
+    try:
+        yield tracked
+    finally:
+        _active_tracker[0] = None
+
 
-def test_graphql__filter(graphql: GraphQLClient):
+def test_graphql__filter(graphql: GraphQLClient, superuser):
     example = ExampleFactory.create(name="foo", example_state=ExampleState.ACTIVE)
     ExampleFactory.create(name="foobar")
 
@@ -30,18 +79,17 @@ def test_graphql__filter(graphql: GraphQLClient):
         "examples",
         connection=True,
         name_en=example.name_en,
-        example_state=[ExampleState.ACTIVE, ExampleState.INACTIVE],
+        example_state=BOTH_STATES,
     )
 
-    graphql.login_with_superuser()
-    response = graphql(query)
+    response = graphql.execute_raw(query, user=superuser)
 
     assert response.has_errors is False, response
     assert len(response.edges) == 1
     assert response.node() == {"pk": example.pk}
 
 
-def test_graphql__filter__relation(graphql: GraphQLClient):
+def test_graphql__filter__relation(graphql: GraphQLClient, superuser):
     # Test that filtering via a relation does not make an additional query
     # to fetch related items for checking whether the related objects exist.
     example = ExampleFactory.create(name="foo")
@@ -49,28 +97,23 @@ def test_graphql__filter__relation(graphql: GraphQLClient):
 
     query = build_query("examples", connection=True, forward_one_to_one_field=example.forward_one_to_one_field.pk)
 
-    graphql.login_with_superuser()
-    response = graphql(query)
+    response = graphql.execute_raw(query, user=superuser)
 
     assert response.has_errors is False, response
     assert len(response.edges) == 1
     assert response.node() == {"pk": example.pk}
 
-    # 1) Get session
-    # 2) Get user
-    # 3) Count objects for pagination
-    # 4) Fetch for objects
-    response.assert_query_count(4)
+    # 1) Count objects for pagination
+    # 2) Fetch for objects
+    response.assert_query_count(2)
 
 
-def test_graphql__filter__combination_filter(graphql: GraphQLClient):
-    example_1 = ExampleFactory.create(name="foo1", number=1)
-    example_2 = ExampleFactory.create(name="foo2", number=2)
+def test_graphql__filter__combination_filter(graphql: GraphQLClient, superuser):
+    example_1, example_2 = ExampleFactory.bulk_create([{"name": "foo1", "number": 1}, {"name": "foo2", "number": 2}])
 
     query = build_query("examples", connection=True, order_by="nameEnAsc", one=example_1.number, two=example_2.number)
 
-    graphql.login_with_superuser()
-    response = graphql(query)
+    response = graphql.execute_raw(query, user=superuser)
 
     assert response.has_errors is False, response
     assert len(response.edges) == 2
@@ -78,7 +121,24 @@ def test_graphql__filter__combination_filter(graphql: GraphQLClient):
     assert response.node(1) == {"pk": example_2.pk}
 
 
-def test_graphql__filter__user_defined(graphql: GraphQLClient):
+EXPECTED_FILTERS_USER_DEFINED = {
+    "name": "ExampleNodeConnection",
+    "children": {},
+    "filters": {
+        "filter": {
+            "field": "name_en",  # Actually enum nameEn, but has value name_en.
+            "operation": "EXACT",
+            "value": "foo",
+        },
+    },
+    "filterset_class": ExampleFilterSet,
+    "is_connection": True,
+    "is_node": False,
+    "max_limit": 100,
+}
+
+
+def test_graphql__filter__user_defined(graphql: GraphQLClient, superuser):
     example = ExampleFactory.create(name="foo")
     ExampleFactory.create(name="foobar")
 
@@ -100,44 +160,18 @@ def test_graphql__filter__user_defined(graphql: GraphQLClient):
         }
     """
 
-    graphql.login_with_superuser()
-
-    selections = []
-    filters = {}
-
-    def tracker(info: GQLInfo, model: type[models.Model]):
-        nonlocal selections, filters
-        if not selections:
-            selections = get_field_selections(info, model)
-        filters = get_filter_info(info, model)
-        return filters
-
-    with patch("query_optimizer.optimizer.get_filter_info", side_effect=tracker):
-        response = graphql(query)
-
-    assert selections == ["pk"]
-    assert filters == {
-        "name": "ExampleNodeConnection",
-        "children": {},
-        "filters": {
-            "filter": {
-                "field": "name_en",  # Actually enum nameEn, but has value name_en.
-                "operation": "EXACT",
-                "value": "foo",
-            },
-        },
-        "filterset_class": ExampleFilterSet,
-        "is_connection": True,
-        "is_node": False,
-        "max_limit": 100,
-    }
+    with track_filter_info() as tracked:
+        response = graphql.execute_raw(query, user=superuser)
+
+    assert tracked.selections == ["pk"]
+    assert tracked.filters == EXPECTED_FILTERS_USER_DEFINED
 
     assert response.has_errors is False, response
     assert len(response.edges) == 1
     assert response.node() == {"pk": example.pk}
 
 
-def test_graphql__filter__user_defined__related_alias(graphql: GraphQLClient):
+def test_graphql__filter__user_defined__related_alias(graphql: GraphQLClient, superuser):
     example = ExampleFactory.create(name="foo", forward_one_to_one_field__name="bar")
     ExampleFactory.create(name="foobar")
 
@@ -159,15 +193,59 @@ def test_graphql__filter__user_defined__related_alias(graphql: GraphQLClient):
         }
     """
 
-    graphql.login_with_superuser()
-    response = graphql(query)
+    response = graphql.execute_raw(query, user=superuser)
 
     assert response.has_errors is False, response
     assert len(response.edges) == 1
     assert response.node() == {"pk": example.pk}
 
 
-def test_graphql__filter__user_defined__complex_filter(graphql: GraphQLClient):
+EXPECTED_FILTERS_COMPLEX = {
+    "name": "ExampleNodeConnection",
+    "children": {},
+    "filters": {
+        "filter": {
+            "field": None,
+            "operation": "AND",
+            "operations": [
+                {
+                    "field": None,
+                    "operation": "OR",
+                    "operations": [
+                        {
+                            "field": "name_en",  # Actually enum nameEn, but has value name_en.
+                            "operation": "CONTAINS",
+                            "value": "foo",
+                        },
+                        {
+                            "field": "email",
+                            "operation": "CONTAINS",
+                            "value": "foo",
+                        },
+                    ],
+                },
+                {
+                    "field": None,
+                    "operation": "NOT",
+                    "operations": [
+                        {
+                            "field": "number",
+                            "operation": "LT",
+                            "value": 10,
+                        },
+                    ],
+                },
+            ],
+        }
+    },
+    "filterset_class": ExampleFilterSet,
+    "is_connection": True,
+    "is_node": False,
+    "max_limit": 100,
+}
+
+
+def test_graphql__filter__user_defined__complex_filter(graphql: GraphQLClient, superuser):
     example = ExampleFactory.create(name="foo", number=10)
     ExampleFactory.create(name="foobar")
 
@@ -214,80 +292,55 @@ def test_graphql__filter__user_defined__complex_filter(graphql: GraphQLClient):
         }
     """
 
-    graphql.login_with_superuser()
-
-    selections = []
-    filters = {}
-
-    def tracker(info: GQLInfo, model: type[models.Model]):
-        nonlocal selections, filters
-        if not selections:
-            selections = get_field_selections(info, model)
-        filters = get_filter_info(info, model)
-        return filters
-
-    with patch("query_optimizer.optimizer.get_filter_info", side_effect=tracker):
-        response = graphql(query)
-
-    assert selections == ["pk"]
-    assert filters == {
-        "name": "ExampleNodeConnection",
-        "children": {},
-        "filters": {
-            "filter": {
-                "field": None,
-                "operation": "AND",
-                "operations": [
-                    {
-                        "field": None,
-                        "operation": "OR",
-                        "operations": [
-                            {
-                                "field": "name_en",  # Actually enum nameEn, but has value name_en.
-                                "operation": "CONTAINS",
-                                "value": "foo",
-                            },
-                            {
-                                "field": "email",
-                                "operation": "CONTAINS",
-                                "value": "foo",
-                            },
-                        ],
-                    },
-                    {
-                        "field": None,
-                        "operation": "NOT",
-                        "operations": [
-                            {
-                                "field": "number",
-                                "operation": "LT",
-                                "value": 10,
-                            },
-                        ],
-                    },
-                ],
-            }
-        },
-        "filterset_class": ExampleFilterSet,
-        "is_connection": True,
-        "is_node": False,
-        "max_limit": 100,
-    }
+    with track_filter_info() as tracked:
+        response = graphql.execute_raw(query, user=superuser)
+
+    assert tracked.selections == ["pk"]
+    assert tracked.filters == EXPECTED_FILTERS_COMPLEX
 
     assert response.has_errors is False, response
     assert len(response.edges) == 1
     assert response.node() == {"pk": example.pk}
 
 
-def test_graphql__filter__user_defined__all_many_related(graphql: GraphQLClient):
-    example_1 = ExampleFactory.create()
-    example_2 = ExampleFactory.create()
-
-    ReverseManyToManyFactory.create(name="foo", example_fields=[example_1])
-    ReverseManyToManyFactory.create(name="bar", example_fields=[example_1])
-
-    ReverseManyToManyFactory.create(name="foo", example_fields=[example_2])
-    ReverseManyToManyFactory.create(name="baz", example_fields=[example_2])
+EXPECTED_FILTERS_ALL_MANY_RELATED = {
+    "name": "ExampleNodeConnection",
+    "children": {},
+    "filters": {
+        "filter": {
+            "field": None,
+            "operation": "ALL",
+            "operations": [
+                {
+                    "field": "reverse_many_to_many_rels__name",
+                    "operation": "EXACT",
+                    "value": "foo",
+                },
+                {
+                    "field": "reverse_many_to_many_rels__name",
+                    "operation": "EXACT",
+                    "value": "bar",
+                },
+            ],
+        }
+    },
+    "filterset_class": ExampleFilterSet,
+    "is_connection": True,
+    "is_node": False,
+    "max_limit": 100,
+}
+
+
+def test_graphql__filter__user_defined__all_many_related(graphql: GraphQLClient, superuser):
+    example_1, example_2 = ExampleFactory.bulk_create([{}, {}])
+    ReverseManyToManyFactory.bulk_create(
+        [
+            {"name": "foo", "example_fields": [example_1]},
+            {"name": "bar", "example_fields": [example_1]},
+            {"name": "foo", "example_fields": [example_2]},
+            {"name": "baz", "example_fields": [example_2]},
+        ],
+    )
 
     query = """
         query {
@@ -317,52 +370,46 @@ def test_graphql__filter__user_defined__all_many_related(graphql: GraphQLClient)
         }
     """
 
-    graphql.login_with_superuser()
-
-    filters = {}
-
-    def tracker(info: GQLInfo, model: type[models.Model]):
-        nonlocal filters
-        filters = get_filter_info(info, model)
-        return filters
-
-    with patch("query_optimizer.optimizer.get_filter_info", side_effect=tracker):
-        response = graphql(query)
+    with track_filter_info() as tracked:
+        response = graphql.execute_raw(query, user=superuser)
 
     assert response.has_errors is False, response.errors
 
-    assert filters == {
-        "name": "ExampleNodeConnection",
-        "children": {},
-        "filters": {
-            "filter": {
-                "field": None,
-                "operation": "ALL",
-                "operations": [
-                    {
-                        "field": "reverse_many_to_many_rels__name",
-                        "operation": "EXACT",
-                        "value": "foo",
-                    },
-                    {
-                        "field": "reverse_many_to_many_rels__name",
-                        "operation": "EXACT",
-                        "value": "bar",
-                    },
-                ],
-            }
-        },
-        "filterset_class": ExampleFilterSet,
-        "is_connection": True,
-        "is_node": False,
-        "max_limit": 100,
-    }
+    assert tracked.filters == EXPECTED_FILTERS_ALL_MANY_RELATED
 
     assert len(response.edges) == 1
     assert response.node() == {"pk": example_1.pk}
 
 
-def test_graphql__filter__user_defined__all_many_related__alias(graphql: GraphQLClient):
+EXPECTED_FILTERS_ALL_MANY_RELATED_ALIAS = {
+    "name": "ExampleNodeConnection",
+    "children": {},
+    "filters": {
+        "filter": {
+            "field": None,
+            "operation": "ALL",
+            "operations": [
+                {
+                    "field": "forward_many_to_many_fields__name",
+                    "operation": "EXACT",
+                    "value": "foo",
+                },
+                {
+                    "field": "forward_many_to_many_fields__name",
+                    "operation": "EXACT",
+                    "value": "bar",
+                },
+            ],
+        }
+    },
+    "filterset_class": ExampleFilterSet,
+    "is_connection": True,
+    "is_node": False,
+    "max_limit": 100,
+}
+
+
+def test_graphql__filter__user_defined__all_many_related__alias(graphql: GraphQLClient, superuser):
     fmtm_1 = ForwardManyToManyFactory.create(name="foo")
     fmtm_2 = ForwardManyToManyFactory.create(name="bar")
     fmtm_3 = ForwardManyToManyFactory.create(name="foo")
@@ -399,102 +446,62 @@ def test_graphql__filter__user_defined__all_many_related__alias(graphql: GraphQL
         }
     """
 
-    graphql.login_with_superuser()
-
-    filters = {}
-
-    def tracker(info: GQLInfo, model: type[models.Model]):
-        nonlocal filters
-        filters = get_filter_info(info, model)
-        return filters
-
-    with patch("query_optimizer.optimizer.get_filter_info", side_effect=tracker):
-        response = graphql(query)
+    with track_filter_info() as tracked:
+        response = graphql.execute_raw(query, user=superuser)
 
     assert response.has_errors is False, response.errors
 
-    assert filters == {
-        "name": "ExampleNodeConnection",
-        "children": {},
-        "filters": {
-            "filter": {
-                "field": None,
-                "operation": "ALL",
-                "operations": [
-                    {
-                        "field": "forward_many_to_many_fields__name",
-                        "operation": "EXACT",
-                        "value": "foo",
-                    },
-                    {
-                        "field": "forward_many_to_many_fields__name",
-                        "operation": "EXACT",
-                        "value": "bar",
-                    },
-                ],
-            }
-        },
-        "filterset_class": ExampleFilterSet,
-        "is_connection": True,
-        "is_node": False,
-        "max_limit": 100,
-    }
+    assert tracked.filters == EXPECTED_FILTERS_ALL_MANY_RELATED_ALIAS
 
     assert len(response.edges) == 1
     assert response.node() == {"pk": example.pk}
 
 
-def test_graphql__filter__list_field(graphql: GraphQLClient):
+EXPECTED_FILTERS_LIST_FIELD = {
+    "name": "ExampleNode",
+    "children": {},
+    "filters": {
+        "example_state": [ExampleState.ACTIVE, ExampleState.INACTIVE],
+        "name_en": "foo",
+    },
+    "filterset_class": ExampleFilterSet,
+    "is_connection": False,
+    "is_node": False,
+    "max_limit": 100,
+}
+
+
+def test_graphql__filter__list_field(graphql: GraphQLClient, superuser):
     example = ExampleFactory.create(name="foo", example_state=ExampleState.ACTIVE)
     ExampleFactory.create(name="foobar")
 
     query = build_query(
         "exampleItems",
         name_en=example.name_en,
-        example_state=[ExampleState.ACTIVE, ExampleState.INACTIVE],
+        example_state=BOTH_STATES,
     )
 
-    graphql.login_with_superuser()
-
-    selections = []
-    filters = {}
-
-    def tracker(info: GQLInfo, model: type[models.Model]):
-        nonlocal selections, filters
-        if not selections:
-            selections = get_field_selections(info, model)
-        filters = get_filter_info(info, model)
-        return filters
+    with track_filter_info() as tracked:
+        response = graphql.execute_raw(query, user=superuser)
 
-    with patch("query_optimizer.optimizer.get_filter_info", side_effect=tracker):
-        response = graphql(query)
-
-    assert selections == ["pk"]
-    assert filters == {
-        "name": "ExampleNode",
-        "children": {},
-        "filters": {
-            "example_state": [ExampleState.ACTIVE, ExampleState.INACTIVE],
-            "name_en": "foo",
-        },
-        "filterset_class": ExampleFilterSet,
-        "is_connection": False,
-        "is_node": False,
-        "max_limit": 100,
-    }
+    assert tracked.selections == ["pk"]
+    assert tracked.filters == EXPECTED_FILTERS_LIST_FIELD
 
     assert response.has_errors is False, response
     assert len(response.first_query_object) == 1
     assert response.first_query_object[0] == {"pk": example.pk}
 
 
-def test_graphql__filter__sub_filter(graphql: GraphQLClient):
-    example_1 = ExampleFactory.create()
-    example_2 = ExampleFactory.create()
-    f1 = ForwardManyToManyFactory.create(name="foo")
-    f2 = ForwardManyToManyFactory.create(name="bar")
-    example_1.forward_many_to_many_fields.add(f1)
-    example_2.forward_many_to_many_fields.add(f2)
+def test_graphql__filter__sub_filter(graphql: GraphQLClient, superuser):
+    example_1, example_2 = ExampleFactory.bulk_create([{}, {}])
+    f1, f2 = ForwardManyToMany.objects.bulk_create([ForwardManyToMany(name="foo"), ForwardManyToMany(name="bar")])
+    through = Example.forward_many_to_many_fields.through
+    through.objects.bulk_create(
+        [
+            through(example=example_1, forwardmanytomany=f1),
+            through(example=example_2, forwardmanytomany=f2),
+        ]
+    )
 
     query = build_query(
         "exampleItems",
@@ -506,28 +513,17 @@ def test_graphql__filter__sub_filter(graphql: GraphQLClient):
         """,
         forward_many_to_many_fields__pk=[f1.pk],
     )
-    graphql.login_with_superuser()
-
-    selections = []
-    filters = {}
-
-    def tracker(info: GQLInfo, model: type[models.Model]):
-        nonlocal selections, filters
-        if not selections:
-            selections = get_field_selections(info, model)
-        filters = get_filter_info(info, model)
-        return filters
 
-    with patch("query_optimizer.optimizer.get_filter_info", side_effect=tracker):
-        response = graphql(query)
+    with track_filter_info() as tracked:
+        response = graphql.execute_raw(query, user=superuser)
 
-    assert selections == [
+    assert tracked.selections == [
         "pk",
         {
             "forward_many_to_many_fields": ["name"],
         },
     ]
-    assert filters == {
+    assert tracked.filters == {
         "name": "ExampleNode",
         "filters": {},
         "filterset_class": ExampleFilterSet,
@@ -537,7 +533,7 @@ def tracker(info: GQLInfo, model: type[models.Model]):
         "children": {
             "forward_many_to_many_fields": {
                 "name": "ForwardManyToManyNode",
-                "filters": {"pk": [1]},
+                "filters": {"pk": [f1.pk]},
                 "filterset_class": ForwardManyToManyFilterSet,
                 "is_connection": False,
                 "is_node": False,
@@ -1,34 +1,29 @@
-import datetime
-
 import pytest
 
 from example_project.app.models import Example, ExampleState
 from graphene_django_extensions.testing import GraphQLClient, build_mutation
 from tests.factories import ExampleFactory, ForwardManyToOneFactory, ForwardOneToOneFactory
+from tests.helpers import CREATE_INPUT
 
 pytestmark = [
     pytest.mark.django_db,
 ]
 
 
-def test_graphql__create(graphql: GraphQLClient):
-    mto = ForwardManyToOneFactory.create()
-    input_data = {
-        "name": "foo",
-        "number": 123,
-        "email": "foo@email.com",
-        "exampleState": ExampleState.ACTIVE.value,
-        "duration": int(datetime.timedelta(seconds=900).total_seconds()),
-        "forwardOneToOneField": {
-            "name": "Test",
-        },
-        "forwardManyToOneField": mto.pk,
-    }
+@pytest.fixture(scope="module")
+def mto(module_db, django_db_blocker):
+    # Shared by all tests in the module that need an existing many-to-one relation to point to.
+    with django_db_blocker.unblock():
+        return ForwardManyToOneFactory.create()
+
+
+def test_graphql__create(graphql: GraphQLClient, superuser, mto):
+    input_data = {**CREATE_INPUT, "forwardManyToOneField": mto.pk}
 
     fields = "name number email forwardOneToOneField { name } forwardManyToOneField"
     mutation = build_mutation("createExample", "ExampleCreateMutation", fields=fields)
 
-    graphql.login_with_superuser()
+    graphql.force_login(superuser)
     response = graphql(mutation, input_data=input_data)
 
     assert response.has_errors is False, response
@@ -40,11 +35,19 @@ def test_graphql__create(graphql: GraphQLClient):
         "forwardManyToOneField": mto.pk,
     }
 
+    # 1) Get session
+    # 2) Get user
+    # 3) Check email uniqueness
+    # 4) Fetch forward_many_to_one
+    # 5) Check name and number uniqueness
+    # 6) Create forward_one_to_one
+    # 7) Create example
+    response.assert_query_count(7)
+
 
-def test_graphql__update(graphql: GraphQLClient):
+def test_graphql__update(graphql: GraphQLClient, superuser, mto):
     example = ExampleFactory.create(name="foo", number=1)
 
-    mto = ForwardManyToOneFactory.create()
     input_data = {
         "pk": example.pk,
         "name": "foo",
@@ -61,7 +64,7 @@ def test_graphql__update(graphql: GraphQLClient):
     fields = "pk name number email forwardOneToOneField { name } forwardManyToOneField"
     mutation = build_mutation("updateExample", "ExampleUpdateMutation", fields=fields)
 
-    graphql.login_with_superuser()
+    graphql.force_login(superuser)
     response = graphql(mutation, input_data=input_data)
 
     assert response.has_errors is False, response
@@ -75,13 +78,13 @@ def test_graphql__update(graphql: GraphQLClient):
     }
 
 
-def test_graphql__delete(graphql: GraphQLClient):
+def test_graphql__delete(graphql: GraphQLClient, superuser):
     example = ExampleFactory.create(name="foo", number=1)
 
     input_data = {"pk": example.pk}
     mutation = build_mutation("deleteExample", "ExampleDeleteMutation", fields="deleted")
 
-    graphql.login_with_superuser()
+    graphql.force_login(superuser)
     response = graphql(mutation, input_data=input_data)
 
     assert response.has_errors is False, response
@@ -90,11 +93,11 @@ def test_graphql__delete(graphql: GraphQLClient):
     }
 
 
-def test_graphql__custom(graphql: GraphQLClient):
+def test_graphql__custom(graphql: GraphQLClient, superuser):
     input_data = {"name": "foo"}
     mutation = build_mutation("customExample", "ExampleCustomMutation")
 
-    graphql.login_with_superuser()
+    graphql.force_login(superuser)
     response = graphql(mutation, input_data=input_data)
     example = Example.objects.first()
 
@@ -104,23 +107,14 @@ def test_graphql__custom(graphql: GraphQLClient):
     }
 
 
-def test_graphql__form(graphql: GraphQLClient):
+def test_graphql__form(graphql: GraphQLClient, superuser, mto):
     oto = ForwardOneToOneFactory.create()
-    mto = ForwardManyToOneFactory.create()
-    input_data = {
-        "name": "foo",
-        "number": 123,
-        "email": "foo@email.com",
-        "exampleState": ExampleState.ACTIVE.value,
-        "duration": int(datetime.timedelta(seconds=900).total_seconds()),
-        "forwardOneToOneField": oto.pk,
-        "forwardManyToOneField": mto.pk,
-    }
+    input_data = {**CREATE_INPUT, "forwardOneToOneField": oto.pk, "forwardManyToOneField": mto.pk}
 
     fields = "name number email forwardOneToOneField forwardManyToOneField"
     mutation = build_mutation("formMutation", "ExampleFormMutation", fields=fields)
 
-    graphql.login_with_superuser()
+    graphql.force_login(superuser)
     response = graphql(mutation, input_data=input_data)
 
     assert response.has_errors is False, response
@@ -133,11 +127,11 @@ def test_graphql__form(graphql: GraphQLClient):
     }
 
 
-def test_graphql__form__custom(graphql: GraphQLClient):
+def test_graphql__form__custom(graphql: GraphQLClient, superuser):
     input_data = {"name": "foo"}
     mutation = build_mutation("formCustomMutation", "ExampleFormCustomMutation")
 
-    graphql.login_with_superuser()
+    graphql.force_login(superuser)
     response = graphql(mutation, input_data=input_data)
     example = Example.objects.first()
 
@@ -147,24 +141,24 @@ def test_graphql__form__custom(graphql: GraphQLClient):
     }
 
 
-def test_graphql__update__does_not_exist(graphql: GraphQLClient):
+def test_graphql__update__does_not_exist(graphql: GraphQLClient, superuser):
     ExampleFactory.create(name="foo", number=1)
     input_data = {"pk": 0}
 
     mutation = build_mutation("updateExample", "ExampleUpdateMutation", fields="pk")
-    graphql.login_with_superuser()
+    graphql.force_login(superuser)
     response = graphql(mutation, input_data=input_data)
 
     assert response.error_code() == "NOT_FOUND"
     assert response.error_message() == "`Example` object matching query `{'pk': 0}` does not exist."
 
 
-def test_graphql__delete__does_not_exist(graphql: GraphQLClient):
+def test_graphql__delete__does_not_exist(graphql: GraphQLClient, superuser):
     ExampleFactory.create(name="foo", number=1)
     input_data = {"pk": 0}
 
     mutation = build_mutation("deleteExample", "ExampleDeleteMutation", fields="deleted")
-    graphql.login_with_superuser()
+    graphql.force_login(superuser)
     response = graphql(mutation, input_data=input_data)
 
     assert response.error_code() == "NOT_FOUND"
@@ -180,10 +174,10 @@ def test_graphql__file(graphql, mock_png):
     assert response.first_query_object == {"name": "image.png", "success": True}
 
 
-def test_graphql__schema_errors(graphql: GraphQLClient):
+def test_graphql__schema_errors(graphql: GraphQLClient, superuser):
     mutation = build_mutation("createExample", "ExampleCreateMutation", fields="name")
 
-    graphql.login_with_superuser()
+    graphql.force_login(superuser)
     response = graphql(mutation, input_data={})
 
     assert response.has_schema_errors is True, response
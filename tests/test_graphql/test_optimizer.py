@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+import pytest
+
+from example_project.app.models import Example, ForwardManyToMany, ReverseManyToMany, ReverseOneToMany, ReverseOneToOne
+from graphene_django_extensions.testing import GraphQLClient, build_query
+from tests.factories import (
+    ExampleFactory,
+    ForwardManyToManyFactory,
+    ReverseManyToManyFactory,
+    ReverseOneToManyFactory,
+    ReverseOneToOneFactory,
+)
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+class ExampleGraph(NamedTuple):
+    example: Example
+    forward_many_to_many: list[ForwardManyToMany]
+    reverse_one_to_one: ReverseOneToOne
+    reverse_one_to_many: list[ReverseOneToMany]
+    reverse_many_to_many: list[ReverseManyToMany]
+
+
+@pytest.fixture(scope="module")
+def example_graphs(module_db, django_db_blocker) -> list[ExampleGraph]:
+    # Created once for all tests in this module, since the tests only read it.
+    # Rows are bulk created with one INSERT per table.
+    with django_db_blocker.unblock():
+        examples = ExampleFactory.bulk_create([{"name": "a_foo"}, {"name": "b_foo"}])
+
+        forward_many_to_many = ForwardManyToMany.objects.bulk_create(ForwardManyToManyFactory.build_batch(4))
+        through = Example.forward_many_to_many_fields.through
+        through.objects.bulk_create(
+            [
+                through(example=example, forwardmanytomany=forward)
+                for i, example in enumerate(examples)
+                for forward in forward_many_to_many[2 * i : 2 * i + 2]
+            ],
+        )
+
+        reverse_one_to_one = ReverseOneToOne.objects.bulk_create(
+            [ReverseOneToOneFactory.build(example_field=example) for example in examples],
+        )
+        reverse_one_to_many = ReverseOneToMany.objects.bulk_create(
+            [ReverseOneToManyFactory.build(example_field=example) for example in examples for _ in range(2)],
+        )
+        reverse_many_to_many = ReverseManyToManyFactory.bulk_create(
+            [{"example_fields": [example]} for example in examples for _ in range(2)],
+        )
+
+    return [
+        ExampleGraph(
+            example=example,
+            forward_many_to_many=forward_many_to_many[2 * i : 2 * i + 2],
+            reverse_one_to_one=reverse_one_to_one[i],
+            reverse_one_to_many=reverse_one_to_many[2 * i : 2 * i + 2],
+            reverse_many_to_many=reverse_many_to_many[2 * i : 2 * i + 2],
+        )
+        for i, example in enumerate(examples)
+    ]
+
+
+def test_graphql__query__optimizer(graphql: GraphQLClient, superuser, example_graphs):
+    fields = """
+        pk
+        forwardOneToOneField {
+          name
+        }
+        forwardManyToOneField {
+          name
+        }
+    """
+    query = build_query("examples", fields=fields, connection=True, order_by="nameEnAsc")
+
+    response = graphql.execute_raw(query, user=superuser)
+
+    # 1) Count examples for pagination
+    # 2) Fetch examples, forward_one_to_one, and forward_many_to_one
+    response.assert_query_count(2)
+
+    assert response.has_errors is False, response
+    assert len(response.edges) == 2
+    for i, graph in enumerate(example_graphs):
+        assert response.node(i) == {
+            "pk": graph.example.pk,
+            "forwardOneToOneField": {
+                "name": graph.example.forward_one_to_one_field.name,
+            },
+            "forwardManyToOneField": {
+                "name": graph.example.forward_many_to_one_field.name,
+            },
+        }
+
+
+def test_graphql__query__optimizer__all_relations(graphql: GraphQLClient, superuser, example_graphs):
+    fields = """
+        pk
+        forwardOneToOneField {
+          name
+        }
+        forwardManyToOneField {
+          name
+        }
+        forwardManyToManyFields {
+          name
+        }
+        reverseOneToOneRel {
+          name
+        }
+        reverseOneToManyRels {
+          name
+        }
+        reverseManyToManyRels {
+          edges {
+            node {
+              name
+            }
+          }
+        }
+    """
+    query = build_query("examples", fields=fields, connection=True, order_by="nameEnAsc")
+
+    response = graphql.execute_raw(query, user=superuser)
+
+    # 1) Count examples for pagination
+    # 2) Fetch examples, forward_one_to_one, forward_many_to_one, and reverse_one_to_one
+    # 3) Fetch forward_many_to_many
+    # 4) Fetch reverse_one_to_many
+    # 5) Fetch reverse_many_to_many
+    response.assert_query_count(5)
+
+    assert response.has_errors is False, response
+    assert len(response.edges) == 2
+    for i, graph in enumerate(example_graphs):
+        assert response.node(i) == {
+            "pk": graph.example.pk,
+            "forwardOneToOneField": {
+                "name": graph.example.forward_one_to_one_field.name,
+            },
+            "forwardManyToOneField": {
+                "name": graph.example.forward_many_to_one_field.name,
+            },
+            "forwardManyToManyFields": [
+                {"name": graph.forward_many_to_many[0].name},
+                {"name": graph.forward_many_to_many[1].name},
+            ],
+            "reverseOneToOneRel": {
+                "name": graph.reverse_one_to_one.name,
+            },
+            "reverseOneToManyRels": [
+                {"name": graph.reverse_one_to_many[0].name},
+                {"name": graph.reverse_one_to_many[1].name},
+            ],
+            "reverseManyToManyRels": {
+                "edges": [
+                    {"node": {"name": graph.reverse_many_to_many[0].name}},
+                    {"node": {"name": graph.reverse_many_to_many[1].name}},
+                ],
+            },
+        }
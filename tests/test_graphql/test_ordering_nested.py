@@ -0,0 +1,57 @@
+import pytest
+
+from graphene_django_extensions.testing import GraphQLClient, build_query
+from tests.factories import ExampleFactory, ReverseManyToManyFactory
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture(scope="module")
+def reverse_many_to_many_rels(module_db, django_db_blocker):
+    # Shared by the tests in this module, so that the same graph isn't created for each ordering.
+    with django_db_blocker.unblock():
+        example_1, example_2, example_3 = ExampleFactory.bulk_create(
+            [{"name": "1_foo"}, {"name": "3_foo"}, {"name": "2_foo"}],
+        )
+        return ReverseManyToManyFactory.bulk_create(
+            [
+                {"example_fields": [example_1, example_2]},
+                {"example_fields": [example_3, example_2]},
+                {"example_fields": [example_3, example_1]},
+            ],
+        )
+
+
+@pytest.mark.parametrize(
+    ("order_by", "expected"),
+    [
+        ("pkAsc", {"1_foo": [0, 2], "3_foo": [0, 1], "2_foo": [1, 2]}),
+        ("pkDesc", {"1_foo": [2, 0], "3_foo": [1, 0], "2_foo": [2, 1]}),
+    ],
+)
+def test_graphql__ordering__nested(graphql: GraphQLClient, superuser, reverse_many_to_many_rels, order_by, expected):
+    fields = f"name reverseManyToManyRels(orderBy:{order_by}) {{ edges {{ node {{ pk }} }} }}"
+    query = build_query("exampleItems", fields=fields)
+
+    graphql.force_login(superuser)
+    response = graphql(query)
+
+    assert response.has_errors is False, response
+
+    # 1) Get session
+    # 2) Get user
+    # 3) Fetch examples
+    # 4) Fetch reverse_many_to_many_rels for all examples
+    response.assert_query_count(4)
+
+    assert response.first_query_object == [
+        {
+            "name": name,
+            "reverseManyToManyRels": {
+                "edges": [{"node": {"pk": reverse_many_to_many_rels[index].pk}} for index in indices],
+            },
+        }
+        for name, indices in expected.items()
+    ]
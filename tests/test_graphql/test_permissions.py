@@ -1,11 +1,9 @@
-import datetime
-
 import pytest
 
-from example_project.app.models import ExampleState
 from example_project.app.nodes import ExampleNode
 from graphene_django_extensions.testing import GraphQLClient, build_mutation, build_query
 from tests.factories import ExampleFactory, ForwardManyToOneFactory
+from tests.helpers import CREATE_INPUT
 
 pytestmark = [
     pytest.mark.django_db,
@@ -86,9 +84,9 @@ def test_graphql__query__restricted_field__no_perms(graphql: GraphQLClient):
     ]
 
 
-def test_graphql__query__restricted_field__has_perms(graphql: GraphQLClient):
+def test_graphql__query__restricted_field__has_perms(graphql: GraphQLClient, superuser):
     ExampleFactory.create()
-    graphql.login_with_superuser()
+    graphql.force_login(superuser)
 
     query = build_query("examples", fields="pk email", connection=True)
 
@@ -100,17 +98,7 @@ def test_graphql__query__restricted_field__has_perms(graphql: GraphQLClient):
 
 def test_graphql__create__permission_error(graphql: GraphQLClient):
     mto = ForwardManyToOneFactory.create()
-    input_data = {
-        "name": "foo",
-        "number": 123,
-        "email": "foo@email.com",
-        "exampleState": ExampleState.ACTIVE.value,
-        "duration": int(datetime.timedelta(seconds=900).total_seconds()),
-        "forwardOneToOneField": {
-            "name": "Test",
-        },
-        "forwardManyToOneField": mto.pk,
-    }
+    input_data = {**CREATE_INPUT, "forwardManyToOneField": mto.pk}
 
     mutation = build_mutation("createExample", "ExampleCreateMutation")
     response = graphql(mutation, input_data=input_data)
@@ -0,0 +1,109 @@
+import pytest
+
+from graphene_django_extensions.testing import GraphQLClient, build_query
+from tests.factories import ExampleFactory
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.mark.parametrize("experimental_translation_fields", ["types"], indirect=True)
+def test_graphql__query__translations__accept_language(
+    graphql: GraphQLClient, superuser, experimental_translation_fields
+):
+    example = ExampleFactory.create(name_fi="foo")
+
+    fields = """
+        pk
+        name
+    """
+    query = build_query("examples", fields=fields, connection=True)
+    graphql.force_login(superuser)
+    response = graphql(query, headers={"Accept-Language": "fi"})
+
+    assert response.has_errors is False, response
+    assert len(response.edges) == 1
+    assert response.node(0) == {
+        "pk": example.pk,
+        "name": example.name_fi,
+    }
+
+
+@pytest.mark.parametrize("experimental_translation_fields", ["types"], indirect=True)
+def test_graphql__query__translations__accept_language__null(
+    graphql: GraphQLClient, superuser, experimental_translation_fields
+):
+    example = ExampleFactory.create()
+    assert example.name_fi is None
+
+    fields = """
+        pk
+        name
+    """
+    query = build_query("examples", fields=fields, connection=True)
+    graphql.force_login(superuser)
+    response = graphql(query, headers={"Accept-Language": "fi"})
+
+    assert response.has_errors is False, response
+    assert len(response.edges) == 1
+    assert response.node(0) == {
+        "pk": example.pk,
+        "name": "",  # empty, since field cannot be null
+    }
+
+
+@pytest.mark.parametrize("experimental_translation_fields", ["types"], indirect=True)
+def test_graphql__query__translations__types(graphql: GraphQLClient, superuser, experimental_translation_fields):
+    example = ExampleFactory.create()
+
+    fields = """
+        pk
+        name
+        nameTranslations { fi en }
+    """
+    query = build_query("examples", fields=fields, connection=True)
+    graphql.force_login(superuser)
+    response = graphql(query)
+
+    assert response.has_errors is False, response
+    assert len(response.edges) == 1
+    assert response.node(0) == {
+        "pk": example.pk,
+        "name": example.name_en,
+        "nameTranslations": {
+            "fi": example.name_fi,
+            "en": example.name_en,
+        },
+    }
+
+
+@pytest.mark.parametrize("experimental_translation_fields", ["list"], indirect=True)
+def test_graphql__query__translations__list(graphql: GraphQLClient, superuser, experimental_translation_fields):
+    example = ExampleFactory.create()
+
+    fields = """
+        pk
+        name
+        nameTranslations { language value }
+    """
+    query = build_query("examples", fields=fields, connection=True)
+    graphql.force_login(superuser)
+    response = graphql(query)
+
+    assert response.has_errors is False, response
+    assert len(response.edges) == 1
+    assert response.node(0) == {
+        "pk": example.pk,
+        "name": example.name_en,
+        "nameTranslations": [
+            {
+                "language": "en",
+                "value": example.name_en,
+            },
+            {
+                "language": "fi",
+                "value": example.name_fi,
+            },
+        ],
+    }
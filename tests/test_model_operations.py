@@ -56,6 +56,15 @@ def test_get_related_field_info():
     }
 
 
+def test_get_related_field_info__copy():
+    info = get_related_field_info(Example)
+    info["foo"] = info.pop("forward_one_to_one_field")
+
+    info = get_related_field_info(Example)
+    assert "foo" not in info
+    assert "forward_one_to_one_field" in info
+
+
 def test_related_field_info():
     info = RelatedFieldInfo(
         field_name="forward_one_to_one_field",
@@ -2,11 +2,11 @@
 
 import datetime
 import re
-from copy import deepcopy
 from typing import Any
 
 import pytest
 from django.contrib.auth.models import User
+from django.db import connection
 from django.http import HttpRequest
 from rest_framework import __version__ as drf_version
 from rest_framework.exceptions import ValidationError
@@ -24,6 +24,7 @@
 )
 from graphene_django_extensions.converters import convert_serializer_fields_to_not_required
 from graphene_django_extensions.serializers import NestingModelSerializer, NotProvided
+from graphene_django_extensions.testing.utils import capture_database_queries
 from tests.factories import (
     ExampleFactory,
     ForwardManyToManyFactory,
@@ -176,8 +177,10 @@ def get_example_data_no_fields() -> dict[str, Any]:
     f_o2o = ForwardOneToOneFactory.create(name="one")
     f_m2o = ForwardManyToOneFactory.create(name="two")
     f_m2m = ForwardManyToManyFactory.create(name="three")
-    r_oto = ReverseOneToOneFactory.create(name="four")
-    r_otm = ReverseOneToManyFactory.create(name="five")
+    # Reverse relations are moved to the new example, so they can share the example they are created for.
+    example = ExampleFactory.create()
+    r_oto = ReverseOneToOneFactory.create(name="four", example_field=example)
+    r_otm = ReverseOneToManyFactory.create(name="five", example_field=example)
     r_m2m = ReverseManyToManyFactory.create(name="six")
 
     return {
@@ -195,12 +198,30 @@ def get_example_data_no_fields() -> dict[str, Any]:
     }
 
 
+def fetch_examples() -> list[Example]:
+    # Fetch all relations checked in the tests up front, instead of one query per relation.
+    queryset = Example.objects.select_related(
+        "forward_one_to_one_field",
+        "forward_many_to_one_field",
+        "reverse_one_to_one_rel",
+    ).prefetch_related(
+        "forward_many_to_many_fields",
+        "reverse_one_to_many_rels",
+        "reverse_many_to_many_rels",
+    )
+    return list(queryset)
+
+
 def test_nesting_model_serializer__create():
     serializer = ExampleSerializer(data=get_example_data())
     assert serializer.is_valid(raise_exception=True)
-    serializer.save()
 
-    examples: list[Example] = list(Example.objects.all())
+    with capture_database_queries() as results:
+        serializer.save()
+
+    assert len(results.queries) == 12, results.log
+
+    examples: list[Example] = fetch_examples()
     assert len(examples) == 1
 
     items_1: list[ForwardManyToMany] = list(examples[0].forward_many_to_many_fields.all())
@@ -230,7 +251,7 @@ def test_nesting_model_serializer__update():
     mto_pk = example.forward_many_to_one_field.pk
     mto_name = example.forward_many_to_one_field.name
 
-    update_data = deepcopy(get_example_data())
+    update_data = get_example_data()
     update_data["pk"] = example.pk
     update_data["forward_one_to_one_field"]["pk"] = oto_pk
     update_data["forward_many_to_one_field"] = {"pk": example.forward_many_to_one_field.pk}
@@ -239,9 +260,13 @@ def test_nesting_model_serializer__update():
 
     serializer = update_serializer(instance=example, data=update_data)
     assert serializer.is_valid(raise_exception=True)
-    serializer.save()
 
-    examples: list[Example] = list(Example.objects.all())
+    with capture_database_queries() as results:
+        serializer.save()
+
+    assert len(results.queries) == 13, results.log
+
+    examples: list[Example] = fetch_examples()
     assert len(examples) == 1
 
     items_1: list[ForwardManyToMany] = list(examples[0].forward_many_to_many_fields.all())
@@ -280,6 +305,39 @@ def test_nesting_model_serializer__unique_error():
         serializer.save()
 
 
+class ExampleDatabaseConstraintSerializer(ExampleSerializer):
+    class Meta(ExampleSerializer.Meta):
+        rely_on_db_constraints = True
+
+
+def test_nesting_model_serializer__unique_error__rely_on_db_constraints():
+    ExampleFactory.create(name="foo", number=1, email="foofoo@email.com")
+
+    serializer = ExampleDatabaseConstraintSerializer(data=get_example_data())
+    assert serializer.is_valid(raise_exception=True)
+
+    msg = "Example unique violation message."
+    with pytest.raises(ValidationError, match=re.escape(msg)):
+        serializer.save()
+
+
+class ExampleDatabaseConstraintNoFieldsSerializer(ExampleSerializerNoFields):
+    class Meta(ExampleSerializerNoFields.Meta):
+        rely_on_db_constraints = True
+
+
+def test_nesting_model_serializer__rely_on_db_constraints__no_unique_queries():
+    data = get_example_data_no_fields()
+    serializer = ExampleDatabaseConstraintNoFieldsSerializer(data=data)
+
+    with capture_database_queries() as results:
+        assert serializer.is_valid(raise_exception=True)
+
+    # Only related entities are fetched. Unique fields on the example, including
+    # the one-to-one relation, are not checked before saving.
+    assert not any('FROM "app_example"' in query for query in results.queries), results.log
+
+
 def test_nesting_model_serializer__constraint_error():
     data = get_example_data()
     data["name"] = "bar"
@@ -299,10 +357,9 @@ def test_serializer_get_or_default():
     assert serializer.get_or_default("example_state", data) == NotProvided
 
 
-@pytest.mark.django_db()
 def test_serializer_request_user():
     request = Request(HttpRequest())
-    request.user = user = User.objects.create_user(username="foo", email="foo@example.com")
+    request.user = user = User(username="foo", email="foo@example.com")
     serializer = ExampleSerializer(context={"request": request})
     assert serializer.request_user == user
 
@@ -326,3 +383,119 @@ def test_nesting_model_serializer__integer_fields():
     assert example.reverse_one_to_one_rel.name == "four"
     assert r_o2m.name == "five"
     assert r_m2m.name == "six"
+
+
+class ExampleCachedFieldsSerializer(ExampleSerializer):
+    class Meta(ExampleSerializer.Meta):
+        cache_fields = True
+
+
+class ExampleContextSerializer(ExampleSerializer):
+    def get_extra_kwargs(self) -> dict[str, Any]:
+        return {"name": {"read_only": self.context.get("read_only", False)}}
+
+
+def test_nesting_model_serializer__cache_fields():
+    serializer_1 = ExampleCachedFieldsSerializer()
+    serializer_2 = ExampleCachedFieldsSerializer()
+
+    # Fields are copies, so that binding them to one serializer doesn't affect the other.
+    assert serializer_1.fields["name"] is not serializer_2.fields["name"]
+    assert serializer_1.fields["name"].parent is serializer_1
+    assert serializer_2.fields["name"].parent is serializer_2
+
+    # Copied fields work the same way as fields built for the instance.
+    expected = ExampleSerializer().fields
+    for name, field in serializer_2.fields.items():
+        assert type(field) is type(expected[name]), name
+        assert repr(field) == repr(expected[name]), name
+        assert getattr(field, "enum", None) == getattr(expected[name], "enum", None), name
+
+    cached = ExampleCachedFieldsSerializer(data=get_example_data())
+    built = ExampleSerializer(data=get_example_data())
+    assert cached.is_valid(raise_exception=True)
+    assert built.is_valid(raise_exception=True)
+    assert cached.validated_data == built.validated_data
+
+
+def test_nesting_model_serializer__fields_built_per_instance():
+    serializer_1 = ExampleContextSerializer(context={"read_only": True})
+    serializer_2 = ExampleContextSerializer(context={"read_only": False})
+
+    assert serializer_1.fields["name"].read_only is True
+    assert serializer_2.fields["name"].read_only is False
+
+
+def test_convert_serializer_fields_to_not_required__cached():
+    update_serializer = convert_serializer_fields_to_not_required(ExampleSerializer, "pk")
+
+    assert convert_serializer_fields_to_not_required(ExampleSerializer, "pk") is update_serializer
+    assert update_serializer.__name__ == "UpdateExampleSerializer"
+
+
+class ReverseOneToManyBulkSerializer(NestingModelSerializer):
+    class Meta:
+        model = ReverseOneToMany
+        fields = [
+            "pk",
+            "name",
+        ]
+        bulk_create = True
+
+
+class ReverseManyToManyBulkSerializer(NestingModelSerializer):
+    class Meta:
+        model = ReverseManyToMany
+        fields = [
+            "pk",
+            "name",
+        ]
+        bulk_create = True
+
+
+class ExampleBulkSerializer(ExampleSerializer):
+    reverse_one_to_many_rels = ReverseOneToManyBulkSerializer(many=True)
+    reverse_many_to_many_rels = ReverseManyToManyBulkSerializer(many=True)
+
+
+def test_nesting_model_serializer__bulk_create():
+    data = get_example_data()
+    data["reverse_one_to_many_rels"] = [{"name": "five"}, {"name": "seven"}]
+    data["reverse_many_to_many_rels"] = [{"name": "six"}, {"name": "eight"}]
+
+    serializer = ExampleBulkSerializer(data=data)
+    assert serializer.is_valid(raise_exception=True)
+
+    with capture_database_queries() as results:
+        serializer.save()
+
+    inserts = [sql for sql in results.queries if sql.startswith("INSERT")]
+    assert sum('"app_reverseonetomany"' in sql for sql in inserts) == 1
+    assert sum('"app_reversemanytomany"' in sql for sql in inserts) == 1
+
+    example = fetch_examples()[0]
+    assert sorted(item.name for item in example.reverse_one_to_many_rels.all()) == ["five", "seven"]
+    assert sorted(item.name for item in example.reverse_many_to_many_rels.all()) == ["eight", "six"]
+
+
+def test_nesting_model_serializer__bulk_create__rows_not_returned_from_bulk_insert(monkeypatch):
+    monkeypatch.setattr(type(connection.features), "can_return_rows_from_bulk_insert", False)
+
+    data = get_example_data()
+    data["reverse_one_to_many_rels"] = [{"name": "five"}, {"name": "seven"}]
+    data["reverse_many_to_many_rels"] = [{"name": "six"}, {"name": "eight"}]
+
+    serializer = ExampleBulkSerializer(data=data)
+    assert serializer.is_valid(raise_exception=True)
+
+    with capture_database_queries() as results:
+        serializer.save()
+
+    # Entities are created one by one so that their primary keys are known.
+    inserts = [sql for sql in results.queries if sql.startswith("INSERT")]
+    assert sum('"app_reverseonetomany"' in sql for sql in inserts) == 2
+    assert sum('"app_reversemanytomany"' in sql for sql in inserts) == 2
+
+    example = fetch_examples()[0]
+    assert sorted(item.name for item in example.reverse_one_to_many_rels.all()) == ["five", "seven"]
+    assert sorted(item.name for item in example.reverse_many_to_many_rels.all()) == ["eight", "six"]
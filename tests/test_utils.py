@@ -2,6 +2,7 @@
 
 import re
 from typing import Any, NamedTuple
+from unittest.mock import patch
 
 import pytest
 from django.db import models
@@ -159,6 +160,12 @@ class FilterOperationParams(NamedTuple):
     result: list[models.Q]
 
 
+@pytest.fixture(scope="module")
+def user_filter():
+    # Building filters is stateless, so a single filter can be shared by all tests in the module.
+    return UserDefinedFilter(Example, fields=["foo"])
+
+
 @pytest.mark.parametrize(
     **parametrize_helper(
         {
@@ -256,14 +263,12 @@ class FilterOperationParams(NamedTuple):
         },
     ),
 )
-def test_build_filter_operation(op, result):
-    user_filter = UserDefinedFilter(Example, fields=["foo"])
+def test_build_filter_operation(user_filter, op, result):
     filter_result = user_filter.build_user_defined_filters(op)
     assert filter_result.filters == result
 
 
-def test_build_filter_operation__no_field_set():
-    user_filter = UserDefinedFilter(Example, fields=["foo"])
+def test_build_filter_operation__no_field_set(user_filter):
     op = UserDefinedFilterInput(operation=Operation.EXACT)
 
     msg = "Comparison filter operation requires 'field' to be set."
@@ -271,8 +276,7 @@ def test_build_filter_operation__no_field_set():
         user_filter.build_user_defined_filters(op)
 
 
-def test_build_filter_operation__no_operations():
-    user_filter = UserDefinedFilter(Example, fields=["foo"])
+def test_build_filter_operation__no_operations(user_filter):
     op = UserDefinedFilterInput(operation=Operation.AND)
 
     msg = "Logical filter operation requires 'operations' to be set."
@@ -280,8 +284,7 @@ def test_build_filter_operation__no_operations():
         user_filter.build_user_defined_filters(op)
 
 
-def test_build_filter_operation__not_should_have_only_one_operation():
-    user_filter = UserDefinedFilter(Example, fields=["foo"])
+def test_build_filter_operation__not_should_have_only_one_operation(user_filter):
     op = UserDefinedFilterInput(
         operation=Operation.NOT,
         operations=[
@@ -315,6 +318,46 @@ def test_test_client(graphql: GraphQLClient, settings):
     )
 
 
+@pytest.mark.django_db
+def test_test_client__reset(graphql: GraphQLClient, superuser):
+    query = build_query("examples", connection=True)
+    graphql.force_login(superuser)
+    graphql.reset()
+
+    response = graphql(query)
+
+    assert response.error_message() == "No permission to access node."
+
+
+def test_test_client__reset__defaults():
+    client = GraphQLClient(headers={"Accept-Language": "fi"})
+    client.defaults["HTTP_ACCEPT_LANGUAGE"] = "en"
+    client.defaults["HTTP_X_FOO"] = "bar"
+    client.reset()
+
+    assert client.defaults == {"HTTP_ACCEPT_LANGUAGE": "fi"}
+
+
+@pytest.mark.django_db
+def test_test_client__execute_raw(graphql: GraphQLClient, superuser):
+    query = build_query("examples", connection=True)
+    response = graphql.execute_raw(query, user=superuser)
+
+    assert response.has_errors is False, response
+    assert response["examples"] == {"edges": []}
+
+    # No session or user fetching, since middleware is skipped.
+    assert len(response.queries) == 1
+
+
+@pytest.mark.django_db
+def test_test_client__execute_raw__anonymous(graphql: GraphQLClient):
+    query = build_query("examples", connection=True)
+    response = graphql.execute_raw(query)
+
+    assert response.error_message() == "No permission to access node."
+
+
 @pytest.mark.xfail
 @pytest.mark.parametrize(
     ("a", "b"),
@@ -377,6 +420,10 @@ def test_compare_unordered__fail(a, b):
             [1, 2],
             [2, 1],
         ),
+        (
+            ["foo", "bar", "foo"],
+            ["foo", "foo", "bar"],
+        ),
         (
             {"bar": 2, "foo": 1},
             {"foo": 1, "bar": 2},
@@ -393,3 +440,22 @@ def test_compare_unordered__fail(a, b):
 )
 def test_compare_unordered__success(a, b):
     compare_unordered(a, b)
+
+
+def test_user_defined_filter__normalize_fields__cached():
+    fields = ["name", ("example_state", "state")]
+    normalized = UserDefinedFilter._normalize_fields(Example, fields)
+    assert normalized == {"name": "name", "state": "example_state"}
+
+    with patch("graphene_django_extensions.filters.to_camel_case") as mock:
+        assert UserDefinedFilter._normalize_fields(Example, fields) == normalized
+    mock.assert_not_called()
+
+    # Each filter gets its own copy of the normalized fields.
+    assert UserDefinedFilter._normalize_fields(Example, fields) is not normalized
+
+
+def test_user_defined_filter__normalize_fields__list_pairs():
+    fields = [["name", "example_name"], ["example_state", "state"]]
+    normalized = UserDefinedFilter._normalize_fields(Example, fields)
+    assert normalized == {"exampleName": "name", "state": "example_state"}